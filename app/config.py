@@ -46,6 +46,10 @@ class Config:
     EVENT_HISTORY_DAYS = 90  # Export last 90 days of events
     MIN_EARTHQUAKE_MAGNITUDE_EXPORT = 2.5  # Export all earthquakes >= 2.5, UI filters further
     EVENTS_OUTPUT_FILE = os.path.join(FRONTEND_DATA_DIR, "events_data.json")
+    # Columnar Parquet sidecars of the exported events (next to the JSON)
+    EXPORT_PARQUET = os.getenv("EXPORT_PARQUET", "true").lower() == "true"
+    EVENTS_FIRES_PARQUET_FILE = os.path.join(FRONTEND_DATA_DIR, "events_fires.parquet")
+    EVENTS_QUAKES_PARQUET_FILE = os.path.join(FRONTEND_DATA_DIR, "events_earthquakes.parquet")
     
     # Output Files
     FIRE_MODEL_FILE = os.path.join(OUTPUT_DIR, "fire_model_v4.pkl")
@@ -11,12 +11,15 @@ Author: RiskRadar Team
 Date: 2026-01-25
 """
 
-import json
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from config import Config
@@ -33,28 +36,73 @@ CONFIDENCE_THRESHOLDS = {
     "nominal": 30,
     "high": 80
 }
+# Bin edges for np.digitize: < nominal -> 0, < high -> 1, otherwise 2
+CONFIDENCE_BINS = np.array([CONFIDENCE_THRESHOLDS["nominal"], CONFIDENCE_THRESHOLDS["high"]])
 CONFIDENCE_LABELS = {
     0: "low",
     1: "nominal",
     2: "high"
 }
+LABEL_RANKS = {
+    "high": 2,
+    "h": 2,
+    "nominal": 1,
+    "n": 1,
+    "low": 0,
+    "l": 0
+}
+# Common spellings of the labels, looked up before any normalization
+_STR_RANKS = {
+    variant: rank
+    for label, rank in LABEL_RANKS.items()
+    for variant in (label, label.upper(), label.capitalize())
+}
+
+# FIRMS columns used by the fire export (everything else is left behind)
+FIRE_EXPORT_COLUMNS = ['latitude', 'longitude', 'brightness', 'frp', 'acq_date', 'confidence']
+# Columns of the exported event tables, in output order
+FIRE_OUTPUT_COLUMNS = ['lat', 'lon', 'date', 'date_first', 'brightness', 'brightness_avg',
+                       'frp', 'count', 'confidence']
+QUAKE_OUTPUT_COLUMNS = ['lat', 'lon', 'date', 'magnitude', 'depth', 'place', 'type']
+# Packed 0.1° grid cell ids: (lat_idx + offset) * span + (lon_idx + offset)
+GRID_LAT_OFFSET = 900
+GRID_LON_OFFSET = 1800
+GRID_LON_SPAN = 4096
+GRID_CELL_COUNT = (2 * GRID_LAT_OFFSET + 1) * GRID_LON_SPAN
+# Version of the cached export files; bump whenever the cached layout or
+# the aggregation/rounding changes so older caches are never served
+EXPORT_CACHE_VERSION = 2
+# Rows per Parquet row group; each group carries its own min/max statistics
+PARQUET_ROW_GROUP_SIZE = 50_000
+# Detections per chunk when streaming the FIRMS window through the reduction
+FIRE_EXPORT_CHUNK_SIZE = 1_000_000
+# Per-cell reductions as (ufunc, identity). Partial results have the same
+# columns, so merging chunks is just another reduction with this table.
+CELL_REDUCTIONS = {
+    'brightness_max': (np.fmax, np.nan),
+    'brightness_sum': (np.add, 0),
+    'count': (np.add, 0),
+    'frp_max': (np.fmax, np.nan),
+    'date_first': (np.minimum, np.iinfo(np.int64).max),
+    'date_last': (np.maximum, np.iinfo(np.int64).min),
+    'confidence_rank': (np.maximum, 0)
+}
 
 
 def _confidence_rank(value) -> int:
-    if value is None or pd.isna(value):
-        return 0
     if isinstance(value, str):
+        rank = _STR_RANKS.get(value)
+        if rank is not None:
+            return rank
         normalized = value.strip().lower()
-        if normalized in {"high", "h"}:
-            return 2
-        if normalized in {"nominal", "n"}:
-            return 1
-        if normalized in {"low", "l"}:
-            return 0
+        if normalized in LABEL_RANKS:
+            return LABEL_RANKS[normalized]
         try:
             value = float(normalized)
         except ValueError:
             return 0
+    elif value is None or pd.isna(value):
+        return 0
     try:
         score = float(value)
     except (TypeError, ValueError):
@@ -66,17 +114,235 @@ def _confidence_rank(value) -> int:
     return 0
 
 
-def _format_date(value) -> str:
-    if value is None or pd.isna(value):
-        return ""
-    if isinstance(value, datetime):
-        return value.date().isoformat()
-    if hasattr(value, "isoformat"):
-        return value.isoformat()
-    return str(value)
+def _confidence_ranks(values: pd.Series) -> pd.Series:
+    """
+    Vectorized variant of _confidence_rank for a whole confidence column.
+    
+    Numeric scores (and numeric strings) are parsed in one pass; only the
+    remaining labels ("h"/"n"/"l", ...) are normalized and mapped.
+    """
+    scores = pd.to_numeric(values, errors='coerce')
+    labels = None
+    
+    pending = scores.isna() & values.notna()
+    if pending.any():
+        labels = values[pending].map(_STR_RANKS)
+        misses = labels.isna()
+        if misses.any():
+            normalized = values[pending][misses].astype(str).str.strip().str.lower()
+            labels[misses] = normalized.map(LABEL_RANKS)
+            scores[normalized.index] = pd.to_numeric(normalized, errors='coerce')
+    
+    # Unparseable scores (NaN) rank lowest, like in _confidence_rank
+    ranks = pd.Series(
+        np.digitize(scores.fillna(-np.inf).values, CONFIDENCE_BINS),
+        index=values.index
+    )
+    if labels is not None:
+        ranks[labels.index] = labels.fillna(ranks[labels.index])
+    return ranks.astype('int8')
+
+
+def _round_decimals(values, decimals: int) -> np.ndarray:
+    """
+    Round an array the way Python's round() rounds each value.
+    
+    np.round scales first (x * 10**decimals), which can turn a value just
+    above or below a tie (e.g. 357.05) into an exact .5 and round it the
+    other way. Only values whose scaled form is that close to a tie are
+    re-rounded with round(); all others already agree.
+    """
+    values = np.asarray(values, dtype='float64')
+    rounded = np.round(values, decimals)
+    scaled = values * 10.0 ** decimals
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, decimals) for value in values[near_tie].tolist()]
+    return rounded
+
+
+def _value_range(values) -> Dict[str, float]:
+    """Min/max of a numeric column for the statistics block ({0, 0} if empty)."""
+    values = np.asarray(values, dtype='float64')
+    if len(values) == 0:
+        return {"min": 0, "max": 0}
+    return {"min": float(values.min()), "max": float(values.max())}
+
+
+def _reduce_cells(cells: np.ndarray, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Reduce per-row values to one row per grid cell.
+    
+    Cell ids are bounded, so the occupied cells are found with a bincount
+    over the whole id range and numbered densely without sorting. Each
+    column is then reduced with its CELL_REDUCTIONS ufunc in a single
+    bincount (sums) or unbuffered ufunc.at pass. fmax skips NaN like a
+    pandas groupby.
+    
+    Args:
+        cells: Packed grid cell id per row
+        columns: Values per row, keyed by CELL_REDUCTIONS column name
+    
+    Returns:
+        DataFrame with a cell column and one column per reduced input
+    """
+    occupied = np.bincount(cells, minlength=GRID_CELL_COUNT).astype(bool)
+    cell_ids = np.flatnonzero(occupied)
+    index = (np.cumsum(occupied, dtype=np.int32) - 1)[cells]
+    n_cells = len(cell_ids)
+    
+    reduced = {'cell': cell_ids}
+    for name, values in columns.items():
+        ufunc, identity = CELL_REDUCTIONS[name]
+        if ufunc is np.add:
+            totals = np.bincount(index, weights=values, minlength=n_cells)
+            reduced[name] = totals.astype(values.dtype)
+        else:
+            result = np.full(n_cells, identity, dtype=values.dtype)
+            ufunc.at(result, index, values)
+            reduced[name] = result
+    return pd.DataFrame(reduced)
+
+
+def _aggregate_fire_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Per-cell partial statistics (see CELL_REDUCTIONS) for one chunk of detections."""
+    # Detections without a position have no cell (groupby drops NaN keys);
+    # NaN would otherwise cast to INT64_MIN and wrap into a bogus cell id
+    located = np.isfinite(chunk['latitude'].values) & np.isfinite(chunk['longitude'].values)
+    if not located.all():
+        chunk = chunk[located]
+    
+    # Spatial aggregation: Round to 0.1 degree grid, packed into one integer key
+    lat_idx = np.rint(chunk['latitude'].values * 10).astype(np.int64)
+    lon_idx = np.rint(chunk['longitude'].values * 10).astype(np.int64)
+    cells = (lat_idx + GRID_LAT_OFFSET) * GRID_LON_SPAN + (lon_idx + GRID_LON_OFFSET)
+    
+    # Brightness and FRP stay float64 like lat/lon: float32 would move
+    # two-decimal values across a rounding tie (357.05 -> 357.04998)
+    brightness = chunk['brightness'].values.astype(np.float64)
+    valid = ~np.isnan(brightness)
+    acq_days = chunk['acq_date'].values.astype('datetime64[D]').view(np.int64)
+    
+    # NaT is the smallest int64, so it only needs masking for the minimum
+    missing_date = acq_days == np.iinfo(np.int64).min
+    
+    return _reduce_cells(cells, {
+        'brightness_max': brightness,
+        'brightness_sum': np.where(valid, brightness, 0),
+        'count': valid.astype(np.int64),
+        'frp_max': chunk['frp'].values.astype(np.float64),
+        'date_first': np.where(missing_date, CELL_REDUCTIONS['date_first'][1], acq_days),
+        'date_last': acq_days,
+        'confidence_rank': _confidence_ranks(chunk['confidence']).values
+    })
+
+
+def _merge_fire_partials(partials: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine per-cell partial statistics from several chunks."""
+    combined = pd.concat(partials, ignore_index=True)
+    return _reduce_cells(
+        combined['cell'].values,
+        {name: combined[name].values for name in CELL_REDUCTIONS}
+    )
+
+
+def _fingerprint(chunks: Iterable[pd.DataFrame]) -> Tuple[str, int]:
+    """Content hash and row count of a DataFrame read in chunks, used to key cached exports."""
+    digest = hashlib.blake2b(digest_size=16)
+    rows = 0
+    for chunk in chunks:
+        digest.update(pd.util.hash_pandas_object(chunk, index=False).values.tobytes())
+        rows += len(chunk)
+    return digest.hexdigest(), rows
+
+
+def _to_columns(events: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Column-oriented JSON layout ({column: [values, ...]}) of an event table.
+    
+    Numeric columns stay NumPy arrays so orjson encodes them natively
+    (OPT_SERIALIZE_NUMPY, NaN becomes null); other columns become lists.
+    """
+    return {
+        name: (np.ascontiguousarray(column.values)
+               if pd.api.types.is_numeric_dtype(column) else column.tolist())
+        for name, column in events.items()
+    }
+
+
+def _load_cached_export(cache_file: Path) -> Optional[Tuple[pd.DataFrame, Dict[str, float]]]:
+    """Return a previously cached (events, range) export, or None if unavailable."""
+    if not cache_file.exists():
+        return None
+    try:
+        cached = orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable export cache {cache_file}: {e}")
+        return None
+    return pd.DataFrame(cached['events']), cached['range']
+
+
+def _store_cached_export(cache_file: Path, events: pd.DataFrame, value_range: Dict[str, float]):
+    """
+    Persist an export result so identical inputs can skip recomputation.
+    
+    The sliding window gives a new cache key every day, so older files of
+    the same kind (fires_* or quakes_*, any version) are removed and only
+    the latest export is kept.
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(orjson.dumps(
+            {'events': _to_columns(events), 'range': value_range},
+            option=orjson.OPT_SERIALIZE_NUMPY
+        ))
+    except OSError as e:
+        logger.warning(f"Could not write export cache {cache_file}: {e}")
+        return
+    
+    kind = cache_file.name.split('_', 1)[0]
+    for stale in cache_file.parent.glob(f"{kind}_*.json"):
+        if stale != cache_file:
+            try:
+                stale.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove old export cache {stale}: {e}")
 
 
-def export_fire_events(firms_client: FIRMSClient, days: int = 90) -> List[Dict]:
+def _write_parquet(events: pd.DataFrame, path: str) -> bool:
+    """
+    Write an event table as a zstd-compressed Parquet file.
+    
+    Row groups keep column min/max statistics, which lets readers skip
+    groups by lat/lon or date without downloading the whole file. Returns
+    False (with a warning) if pyarrow is not installed.
+    """
+    try:
+        events.to_parquet(
+            path,
+            engine='pyarrow',
+            compression='zstd',
+            index=False,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+            write_statistics=True
+        )
+    except ImportError as e:
+        logger.warning(f"Skipping Parquet export {path}: {e}")
+        return False
+    return True
+
+
+def _format_days(days: np.ndarray) -> np.ndarray:
+    """Format int64 day numbers (days since epoch) as YYYY-MM-DD, '' for NaT."""
+    formatted = np.datetime_as_string(days.view('datetime64[D]'), unit='D')
+    return np.where(days == np.iinfo(np.int64).min, '', formatted)
+
+
+def export_fire_events(
+    firms_client: FIRMSClient,
+    days: int = 90,
+    end_date: Optional[datetime] = None
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
     """
     Export fire detections from the last N days with spatial aggregation.
     
@@ -86,69 +352,97 @@ def export_fire_events(firms_client: FIRMSClient, days: int = 90) -> List[Dict]:
     Args:
         firms_client: FIRMS client instance
         days: Number of days to look back
+        end_date: End of the export window in UTC (default: now)
     
     Returns:
-        List of aggregated fire event dictionaries
+        Tuple of (aggregated fire events table, brightness min/max range)
     """
     logger.info(f"Exporting fire events from the last {days} days...")
     
     if firms_client._data is None or len(firms_client._data) == 0:
         logger.warning("No FIRMS data available")
-        return []
+        return pd.DataFrame(columns=FIRE_OUTPUT_COLUMNS), _value_range([])
     
-    # Filter by date (compare by day to avoid timezone edge cases)
-    cutoff_date = (datetime.utcnow() - timedelta(days=days)).date()
-    recent_fires = firms_client._data[
-        firms_client._data['acq_date'].dt.date >= cutoff_date
-    ].copy()
+    if end_date is None:
+        end_date = datetime.utcnow()
     
-    logger.info(f"Found {len(recent_fires):,} fire detections in date range")
+    def recent_chunks():
+        return firms_client.iter_recent(
+            days,
+            chunksize=FIRE_EXPORT_CHUNK_SIZE,
+            end_date=end_date,
+            columns=FIRE_EXPORT_COLUMNS
+        )
     
-    if len(recent_fires) == 0:
-        return []
+    # First pass: count and hash the detections in the window
+    fingerprint, n_detections = _fingerprint(recent_chunks())
     
-    # Spatial aggregation: Round to 0.1 degree grid
-    recent_fires['grid_lat'] = (recent_fires['latitude'] * 10).round() / 10
-    recent_fires['grid_lon'] = (recent_fires['longitude'] * 10).round() / 10
+    logger.info(f"Found {n_detections:,} fire detections in date range")
     
-    recent_fires['confidence_rank'] = recent_fires['confidence'].apply(_confidence_rank)
-
-    # Aggregate by grid cell
-    aggregated = recent_fires.groupby(['grid_lat', 'grid_lon']).agg({
-        'brightness': ['max', 'mean', 'count'],
-        'frp': 'max',
-        'acq_date': ['min', 'max'],
-        'confidence_rank': 'max'
-    }).reset_index()
-
-    # Flatten column names
-    aggregated.columns = ['lat', 'lon', 'brightness_max', 'brightness_avg', 'count',
-                          'frp_max', 'date_first', 'date_last', 'confidence_rank']
+    if n_detections == 0:
+        return pd.DataFrame(columns=FIRE_OUTPUT_COLUMNS), _value_range([])
+    
+    # Identical detections in the window always aggregate to the same cells
+    cache_file = Path(Config.CACHE_DIR) / f"fires_v{EXPORT_CACHE_VERSION}_{fingerprint}_{days}.json"
+    cached = _load_cached_export(cache_file)
+    if cached is not None:
+        logger.info(f"  ✓ Using cached fire export: {cache_file.name}")
+        return cached
+    
+    # Second pass: aggregate chunk by chunk into running per-cell totals, so
+    # memory grows with the number of cells rather than detections
+    aggregated = None
+    for chunk in recent_chunks():
+        partial = _aggregate_fire_chunk(chunk)
+        aggregated = partial if aggregated is None else _merge_fire_partials([aggregated, partial])
+    
+    # Recover cell centres and finish the statistics
+    aggregated['lat'] = (aggregated['cell'] // GRID_LON_SPAN - GRID_LAT_OFFSET) / 10.0
+    aggregated['lon'] = (aggregated['cell'] % GRID_LON_SPAN - GRID_LON_OFFSET) / 10.0
+    aggregated['brightness_avg'] = aggregated['brightness_sum'] / aggregated['count']
+    aggregated['date_first'] = aggregated['date_first'].where(
+        aggregated['date_first'] != CELL_REDUCTIONS['date_first'][1],
+        np.iinfo(np.int64).min
+    )
     aggregated['confidence'] = aggregated['confidence_rank'].map(CONFIDENCE_LABELS)
     
     logger.info(f"Aggregated to {len(aggregated):,} grid cells")
     
-    # Convert to list of dicts
-    fires = []
-    for _, row in aggregated.iterrows():
-        fire = {
-            'lat': round(float(row['lat']), 1),
-            'lon': round(float(row['lon']), 1),
-            'date': _format_date(row['date_last']),
-            'date_first': _format_date(row['date_first']),
-            'brightness': round(float(row['brightness_max']), 1),
-            'brightness_avg': round(float(row['brightness_avg']), 1),
-            'frp': round(float(row['frp_max']), 1) if pd.notna(row['frp_max']) else None,
-            'count': int(row['count']),
-            'confidence': str(row['confidence'])
-        }
-        fires.append(fire)
+    # Cast once to the output types and format columns in bulk; the table
+    # stays columnar until it is serialized
+    aggregated = aggregated.astype({
+        'lat': 'float64',
+        'lon': 'float64',
+        'brightness_max': 'float64',
+        'brightness_avg': 'float64',
+        'frp_max': 'float64',
+        'count': 'int64',
+        'confidence': 'string'
+    })
+    for column in ['lat', 'lon', 'brightness_max', 'brightness_avg', 'frp_max']:
+        aggregated[column] = _round_decimals(aggregated[column].values, 1)
+    for column in ['date_first', 'date_last']:
+        aggregated[column] = _format_days(aggregated[column].values)
+    aggregated = aggregated.rename(columns={
+        'date_last': 'date',
+        'brightness_max': 'brightness',
+        'frp_max': 'frp'
+    })
+    fires = aggregated[FIRE_OUTPUT_COLUMNS]
+    
+    brightness_range = _value_range(fires['brightness'].values)
+    _store_cached_export(cache_file, fires, brightness_range)
     
     logger.info(f"Exported {len(fires):,} aggregated fire events")
-    return fires
+    return fires, brightness_range
 
 
-def export_earthquake_events(usgs_client: USGSClient, days: int = 90, min_magnitude: float = 2.5) -> List[Dict]:
+def export_earthquake_events(
+    usgs_client: USGSClient,
+    days: int = 90,
+    min_magnitude: float = 2.5,
+    end_date: Optional[datetime] = None
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
     """
     Export all earthquakes from the last N days.
     
@@ -156,43 +450,72 @@ def export_earthquake_events(usgs_client: USGSClient, days: int = 90, min_magnit
         usgs_client: USGS client instance
         days: Number of days to look back
         min_magnitude: Minimum magnitude to include
+        end_date: End of the export window in UTC (default: now)
     
     Returns:
-        List of earthquake event dictionaries
+        Tuple of (earthquake events table, magnitude min/max range)
     """
     logger.info(f"Exporting earthquake events from the last {days} days (min mag {min_magnitude})...")
     
     # Calculate date range
-    end_date = datetime.utcnow()
+    if end_date is None:
+        end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
     
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+    
+    # USGS treats the end date as midnight, so the window is closed and the
+    # response for a given date range is stable
+    cache_file = Path(Config.CACHE_DIR) / (
+        f"quakes_v{EXPORT_CACHE_VERSION}_{start_str}_{end_str}_M{min_magnitude}.json"
+    )
+    cached = _load_cached_export(cache_file)
+    if cached is not None:
+        logger.info(f"  ✓ Using cached earthquake export: {cache_file.name}")
+        return cached
+    
     # Fetch global earthquakes
     quakes_raw = usgs_client.get_global_earthquakes(
-        start_date=start_date.strftime('%Y-%m-%d'),
-        end_date=end_date.strftime('%Y-%m-%d'),
+        start_date=start_str,
+        end_date=end_str,
         min_magnitude=min_magnitude
     )
     
     if not quakes_raw:
         logger.warning("No earthquake data returned from USGS")
-        return []
-    
-    # Convert to our format
-    earthquakes = []
-    for quake in quakes_raw:
-        earthquake = {
-            'lat': round(float(quake.get('latitude', 0)), 4),
-            'lon': round(float(quake.get('longitude', 0)), 4),
-            'date': quake.get('time', ''),
-            'magnitude': round(float(quake.get('mag', 0)), 1),
-            'depth': round(float(quake.get('depth_km', 0)), 1),
-            'place': quake.get('place', 'Unknown'),
-            'type': quake.get('type', 'earthquake')
-        }
-        earthquakes.append(earthquake)
+        return pd.DataFrame(columns=QUAKE_OUTPUT_COLUMNS), _value_range([])
+    
+    # Convert to our format (column-wise; missing fields get the defaults)
+    quakes = pd.DataFrame(quakes_raw)
+    defaults = {
+        'latitude': 0, 'longitude': 0, 'mag': 0, 'depth_km': 0,
+        'time': '', 'place': 'Unknown', 'type': 'earthquake'
+    }
+    for column, default in defaults.items():
+        if column not in quakes:
+            quakes[column] = default
+    quakes = quakes[list(defaults)].fillna(defaults)
+    
+    quakes = quakes.rename(columns={
+        'latitude': 'lat',
+        'longitude': 'lon',
+        'time': 'date',
+        'mag': 'magnitude',
+        'depth_km': 'depth'
+    })
+    # Round like the per-record round() calls; DataFrame.round would move
+    # values such as M4.45 across the magnitude filters in the UI
+    for column, decimals in [('lat', 4), ('lon', 4), ('magnitude', 1), ('depth', 1)]:
+        quakes[column] = _round_decimals(quakes[column].values, decimals)
+    
+    earthquakes = quakes[QUAKE_OUTPUT_COLUMNS]
+    
+    magnitude_range = _value_range(earthquakes['magnitude'].values)
+    _store_cached_export(cache_file, earthquakes, magnitude_range)
     
     logger.info(f"Exported {len(earthquakes):,} earthquake events")
-    return earthquakes
+    return earthquakes, magnitude_range
 
 
 def main():
@@ -203,65 +526,80 @@ def main():
     print(f"\nExporting last {Config.EVENT_HISTORY_DAYS} days of events")
     print(f"Output: {Config.EVENTS_OUTPUT_FILE}\n")
     
+    # One clock for the whole run, shared by both exports and the metadata
+    now = datetime.utcnow()
+    start_date = now - timedelta(days=Config.EVENT_HISTORY_DAYS)
+    generated_at = now.isoformat() + "Z"
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = now.strftime('%Y-%m-%d')
+    
     # Ensure output directory exists
     Path(Config.FRONTEND_DATA_DIR).mkdir(parents=True, exist_ok=True)
     
-    # Initialize clients
+    # Initialize clients and export both event types in parallel: the USGS
+    # request is network-bound, so it runs while FIRMS loads and aggregates
     print("Initializing data clients...")
-    firms_client = FIRMSClient()
     usgs_client = USGSClient()
-    
-    # Export fire events
     print("\n" + "-" * 40)
-    fires = export_fire_events(
-        firms_client, 
-        days=Config.EVENT_HISTORY_DAYS
-    )
-    
-    # Export earthquake events
-    print("\n" + "-" * 40)
-    earthquakes = export_earthquake_events(
-        usgs_client,
-        days=Config.EVENT_HISTORY_DAYS,
-        min_magnitude=Config.MIN_EARTHQUAKE_MAGNITUDE_EXPORT
-    )
-    
-    # Calculate date range
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=Config.EVENT_HISTORY_DAYS)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        quake_future = executor.submit(
+            export_earthquake_events,
+            usgs_client,
+            days=Config.EVENT_HISTORY_DAYS,
+            min_magnitude=Config.MIN_EARTHQUAKE_MAGNITUDE_EXPORT,
+            end_date=now
+        )
+        firms_client = FIRMSClient()
+        fire_future = executor.submit(
+            export_fire_events,
+            firms_client,
+            days=Config.EVENT_HISTORY_DAYS,
+            end_date=now
+        )
+        fires, brightness_range = fire_future.result()
+        earthquakes, magnitude_range = quake_future.result()
     
     # Build output structure
     output = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": generated_at,
         "data_range": {
-            "start": start_date.strftime('%Y-%m-%d'),
-            "end": end_date.strftime('%Y-%m-%d'),
+            "start": start_str,
+            "end": end_str,
             "days": Config.EVENT_HISTORY_DAYS
         },
         "statistics": {
             "total_fires": len(fires),
             "total_earthquakes": len(earthquakes),
-            "fire_brightness_range": {
-                "min": min((f['brightness'] for f in fires), default=0),
-                "max": max((f['brightness'] for f in fires), default=0)
-            } if fires else {"min": 0, "max": 0},
-            "earthquake_magnitude_range": {
-                "min": min((q['magnitude'] for q in earthquakes), default=0),
-                "max": max((q['magnitude'] for q in earthquakes), default=0)
-            } if earthquakes else {"min": 0, "max": 0}
+            "fire_brightness_range": brightness_range,
+            "earthquake_magnitude_range": magnitude_range
         },
-        "fires": fires,
-        "earthquakes": earthquakes
+        "fires": _to_columns(fires),
+        "earthquakes": _to_columns(earthquakes)
     }
     
     # Write to file
     print("\n" + "-" * 40)
     print(f"Writing to {Config.EVENTS_OUTPUT_FILE}...")
     
-    with open(Config.EVENTS_OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    # Serialize once and hand the whole buffer to a single write
+    blob = orjson.dumps(
+        output,
+        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+    )
+    Path(Config.EVENTS_OUTPUT_FILE).write_bytes(blob)
+    
+    file_size = len(blob) / (1024 * 1024)
     
-    file_size = Path(Config.EVENTS_OUTPUT_FILE).stat().st_size / (1024 * 1024)
+    # Parquet sidecars; fires are ordered by packed cell id (latitude first),
+    # so row group statistics are tight on lat
+    parquet_files = []
+    if Config.EXPORT_PARQUET:
+        for events, path in [
+            (fires, Config.EVENTS_FIRES_PARQUET_FILE),
+            (earthquakes, Config.EVENTS_QUAKES_PARQUET_FILE)
+        ]:
+            if _write_parquet(events, path):
+                parquet_files.append(path)
     
     print("\n" + "=" * 70)
     print("EXPORT COMPLETE")
@@ -269,9 +607,11 @@ def main():
     print(f"\n📊 Statistics:")
     print(f"   🔥 Fire events: {len(fires):,}")
     print(f"   🌍 Earthquake events: {len(earthquakes):,}")
-    print(f"   📅 Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+    print(f"   📅 Date range: {start_str} to {end_str}")
     print(f"   💾 File size: {file_size:.2f} MB")
     print(f"\n✅ Output saved to: {Config.EVENTS_OUTPUT_FILE}")
+    for path in parquet_files:
+        print(f"   Parquet sidecar: {path}")
 
 
 if __name__ == "__main__":
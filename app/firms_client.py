@@ -11,7 +11,7 @@ import pandas as pd
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import numpy as np
 from config import Config
 
@@ -41,6 +41,7 @@ class FIRMSClient:
         
         # Cache loaded data
         self._data = None
+        self._data_sorted = False
         self._load_data()
     
     def _load_data(self):
@@ -107,11 +108,61 @@ class FIRMSClient:
             keep='last'
         )
         
+        # Keep detections ordered by date so date windows can be sliced
+        # with a binary search instead of a full boolean mask
+        self._data = self._data.sort_values('acq_date', kind='stable', ignore_index=True)
+        self._data_sorted = True
+        
         logger.info("=" * 70)
         logger.info(f"Combined total: {len(self._data):,} detections")
         logger.info(f"Date range: {self._data['acq_date'].min()} to {self._data['acq_date'].max()}")
         logger.info("=" * 70)
     
+    def iter_recent(
+        self,
+        days: int,
+        chunksize: int = 1_000_000,
+        end_date: Optional[datetime] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the detections of the last N days in bounded chunks.
+        
+        The window starts at midnight (UTC day) N days before end_date. On
+        date-sorted data it is located with a binary search and each chunk
+        is a positional slice, so only one chunk of the selected columns is
+        materialized at a time.
+        
+        Args:
+            days: Number of days to look back
+            chunksize: Maximum number of detections per chunk
+            end_date: End of the window in UTC (default: now)
+            columns: Columns to include (default: all)
+        
+        Yields:
+            DataFrames with at most chunksize detections, oldest first
+        """
+        if self._data is None or len(self._data) == 0:
+            return
+        
+        if end_date is None:
+            end_date = datetime.utcnow()
+        cutoff = pd.Timestamp((end_date - timedelta(days=days)).date())
+        
+        data = self._data
+        if not self._data_sorted:
+            data = data[data['acq_date'] >= cutoff]
+            start, stop = 0, len(data)
+        else:
+            # Missing dates (NaT) sort last and are never inside the window
+            acq_dates = data['acq_date'].values
+            start = acq_dates.searchsorted(np.datetime64(cutoff), side='left')
+            stop = acq_dates.searchsorted(np.datetime64('NaT'), side='left')
+        positions = data.columns.get_indexer(columns) if columns is not None else slice(None)
+        
+        for offset in range(start, stop, chunksize):
+            yield data.iloc[offset:min(offset + chunksize, stop), positions]
+    
     def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance in km between two points."""
         from math import radians, sin, cos, sqrt, atan2
@@ -848,8 +848,8 @@ async function loadEventsData() {
         eventsData = await response.json();
         eventsData = {
             ...eventsData,
-            fires: Array.isArray(eventsData.fires) ? eventsData.fires : [],
-            earthquakes: Array.isArray(eventsData.earthquakes) ? eventsData.earthquakes : []
+            fires: toEventRecords(eventsData.fires),
+            earthquakes: toEventRecords(eventsData.earthquakes)
         };
         console.log(`Loaded ${eventsData.fires?.length || 0} fires, ${eventsData.earthquakes?.length || 0} earthquakes`);
     } catch (error) {
@@ -858,6 +858,25 @@ async function loadEventsData() {
     }
 }
 
+// Event lists are exported column-wise ({ lat: [...], lon: [...], ... });
+// arrays of event objects from older exports are passed through unchanged.
+function toEventRecords(events) {
+    if (Array.isArray(events)) return events;
+    if (!events || typeof events !== 'object') return [];
+
+    const columns = Object.keys(events).filter(column => Array.isArray(events[column]));
+    const length = columns.length > 0 ? events[columns[0]].length : 0;
+    const records = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const record = {};
+        columns.forEach(column => {
+            record[column] = events[column][i];
+        });
+        records[i] = record;
+    }
+    return records;
+}
+
 function getStepDecimals(step) {
     const stepString = String(step);
     if (!stepString.includes('.')) return 0;
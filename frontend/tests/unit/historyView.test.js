@@ -198,3 +198,50 @@ describe('Event Color Coding', () => {
         expect(getQuakeColor(3.0)).toBe('#a78bfa'); // Minor - light purple
     });
 });
+
+describe('Events Data Layout', () => {
+    // Columnar events expansion (replicating dashboard.js logic)
+    function toEventRecords(events) {
+        if (Array.isArray(events)) return events;
+        if (!events || typeof events !== 'object') return [];
+
+        const columns = Object.keys(events).filter(column => Array.isArray(events[column]));
+        const length = columns.length > 0 ? events[columns[0]].length : 0;
+        const records = new Array(length);
+        for (let i = 0; i < length; i++) {
+            const record = {};
+            columns.forEach(column => {
+                record[column] = events[column][i];
+            });
+            records[i] = record;
+        }
+        return records;
+    }
+
+    test('expands columnar events into event objects', () => {
+        const fires = {
+            lat: [34.0, 35.0],
+            lon: [-118.0, -119.0],
+            date: ['2026-01-20', '2026-01-10'],
+            frp: [12.5, null],
+            confidence: ['high', 'nominal']
+        };
+
+        expect(toEventRecords(fires)).toEqual([
+            { lat: 34.0, lon: -118.0, date: '2026-01-20', frp: 12.5, confidence: 'high' },
+            { lat: 35.0, lon: -119.0, date: '2026-01-10', frp: null, confidence: 'nominal' }
+        ]);
+    });
+
+    test('passes through event arrays from older exports', () => {
+        const quakes = [{ lat: 35.0, lon: 139.0, date: '2026-01-22', magnitude: 6.5 }];
+        expect(toEventRecords(quakes)).toBe(quakes);
+    });
+
+    test('handles missing or empty event lists', () => {
+        expect(toEventRecords(undefined)).toEqual([]);
+        expect(toEventRecords(null)).toEqual([]);
+        expect(toEventRecords({})).toEqual([]);
+        expect(toEventRecords({ lat: [], lon: [] })).toEqual([]);
+    });
+});